@@ -1,45 +1,97 @@
+import datetime
 import os
+import re
+import shutil
+import threading
 import time
+from functools import lru_cache
 
 import xbmcgui
 import xbmcvfs
 
 from resources.lib.common import tools
-from resources.lib.database import cache
-from resources.lib.database.premiumizeTransfers import PremiumizeTransfers
-from resources.lib.database.skinManager import SkinManager
-from resources.lib.debrid import all_debrid, premiumize, real_debrid
-from resources.lib.indexers.trakt import TraktAPI
-from resources.lib.indexers.tvdb import TVDBAPI
+from resources.lib.common.thread_pool import ThreadPool
+from resources.lib.modules.global_lock import GlobalLock
 from resources.lib.modules.globals import g
-from resources.lib.modules.providers.install_manager import ProviderInstallManager
+
+# API clients, databases and the provider manager are imported by the functions that use them so that callers only
+# needing a single helper, such as toggle_reuselanguageinvoker, do not pay for loading them
+
+_REUSE_LANGUAGE_INVOKER = re.compile(rb"<reuselanguageinvoker>(true|false)</reuselanguageinvoker>")
+_ACCOUNT_STATUS_CACHE_TIME = datetime.timedelta(minutes=10)
+_provider_update_check_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_provider_install_manager():
+    """
+    Returns a ProviderInstallManager shared by all maintenance phases so it is only constructed once.
+    """
+    from resources.lib.modules.providers.install_manager import ProviderInstallManager
+
+    return ProviderInstallManager()
 
 def update_themes():
     """
     Perform checks for any theme updates.
     """
     if g.get_bool_setting("skin.updateAutomatic"):
+        from resources.lib.database.skinManager import SkinManager
+
         SkinManager().check_for_updates(silent=True)
 
 def update_provider_packages():
     """
     Perform checks for provider package updates.
     """
-    provider_check_stamp = g.get_float_runtime_setting("provider.updateCheckTimeStamp", 0)
+    # Claim the check by stamping it before doing the work so overlapping maintenance runs do not repeat it
+    with _provider_update_check_lock, GlobalLock("provider.updateCheck"):
+        check_time = time.time()
+        if check_time <= g.get_float_runtime_setting("provider.updateCheckTimeStamp", 0) + 24 * 60 * 60:
+            return
+        g.set_runtime_setting("provider.updateCheckTimeStamp", str(check_time))
+
     automatic = g.get_bool_setting("providers.autoupdates")
-    if time.time() > (provider_check_stamp + 24 * 60 * 60):
-        available_updates = ProviderInstallManager().check_for_updates(silent=True, automatic=automatic)
-        if not automatic and available_updates:
-            g.notification(g.ADDON_NAME, g.get_language_string(30253))
-        g.set_runtime_setting("provider.updateCheckTimeStamp", str(time.time()))
+    try:
+        provider_install_manager = _get_provider_install_manager()
+        provider_install_manager.poll_database()
+        available_updates = provider_install_manager.check_for_updates(silent=True, automatic=automatic)
+    except Exception:
+        # Back off the claimed stamp so a failed check is retried within the hour rather than tomorrow
+        g.set_runtime_setting("provider.updateCheckTimeStamp", str(check_time - 23 * 60 * 60))
+        raise
+    if not automatic and available_updates:
+        g.notification(g.ADDON_NAME, g.get_language_string(30253))
+
+def _refresh_api_token(api_class):
+    """
+    Refresh a single API token, logging rather than raising failures so other refreshes are unaffected.
+    """
+    try:
+        api_class().try_refresh_token()
+    except Exception as e:
+        g.log(f"Failed to refresh {api_class.__name__} token: {e}", "error")
 
 def refresh_apis():
     """
-    Refresh common API tokens.
+    Refresh common API tokens concurrently.
     """
-    TraktAPI().try_refresh_token()
-    real_debrid.RealDebrid().try_refresh_token()
-    TVDBAPI().try_refresh_token()
+    from resources.lib.debrid import real_debrid
+    from resources.lib.indexers.trakt import TraktAPI
+    from resources.lib.indexers.tvdb import TVDBAPI
+
+    api_token_expiry_settings = (
+        (TraktAPI, "trakt.expires"),
+        (real_debrid.RealDebrid, real_debrid.RD_EXPIRY_KEY),
+        (TVDBAPI, "tvdb.expiry"),
+    )
+
+    thread_pool = ThreadPool()
+    for api_class, expiry_setting in api_token_expiry_settings:
+        # Unexpired tokens would not be refreshed anyway, so avoid constructing the client at all
+        if g.get_float_setting(expiry_setting) > time.time():
+            continue
+        thread_pool.put(_refresh_api_token, api_class)
+    thread_pool.wait_completion()
 
 def wipe_install():
     """
@@ -57,14 +109,22 @@ def wipe_install():
         return
 
     path = tools.validate_path(g.ADDON_USERDATA_PATH)
-    if xbmcvfs.exists(path):
-        xbmcvfs.rmdir(path, True)
-    xbmcvfs.mkdir(g.ADDON_USERDATA_PATH)
+    if tools.is_local_path(path):
+        # Local folders are removed directly instead of entry by entry through Kodi's VFS
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+    else:
+        if xbmcvfs.exists(path):
+            xbmcvfs.rmdir(path, True)
+        xbmcvfs.mkdir(g.ADDON_USERDATA_PATH)
 
 def premiumize_transfer_cleanup():
     """
     Cleanup transfers created by Seren at Premiumize.
     """
+    from resources.lib.database.premiumizeTransfers import PremiumizeTransfers
+    from resources.lib.debrid import premiumize
+
     service = premiumize.Premiumize()
     premiumize_transfers = PremiumizeTransfers()
     fair_usage = service.get_used_space()
@@ -83,15 +143,37 @@ def premiumize_transfer_cleanup():
         g.log("No Premiumize transfers have been created")
         return
 
+    def delete_transfer(transfer_id):
+        """
+        Delete a transfer at Premiumize, returning its ID if the request did not fail.
+        """
+        try:
+            service.delete_transfer(transfer_id)
+            return [transfer_id]
+        except Exception as e:
+            g.log(f"Failed to delete Premiumize transfer {transfer_id}: {e}", "error")
+
     g.log("Premiumize Fair Usage is above threshold, cleaning up Seren transfers")
-    for transfer in seren_transfers:
-        service.delete_transfer(transfer["transfer_id"])
-        premiumize_transfers.remove_premiumize_transfer(transfer["transfer_id"])
+    deleted_transfer_ids = ThreadPool().map_results(
+        delete_transfer, ((transfer["transfer_id"],) for transfer in seren_transfers)
+    ) or []
+    if deleted_transfer_ids:
+        premiumize_transfers.remove_premiumize_transfers(deleted_transfer_ids)
+    g.log(f"Removed {len(deleted_transfer_ids)} of {len(seren_transfers)} Seren transfers from Premiumize")
 
 def account_premium_status_checks():
     """
     Updates premium status settings to reflect current state and advises users of expiries if enabled.
     """
+    from resources.lib.database import cache
+    from resources.lib.debrid import all_debrid, premiumize, real_debrid
+
+    debrid_providers = (
+        ("Real Debrid", real_debrid.RealDebrid, "rd"),
+        ("Premiumize", premiumize.Premiumize, "premiumize"),
+        ("All Debrid", all_debrid.AllDebrid, "alldebrid"),
+    )
+
     def set_settings_status(debrid_provider, status):
         """
         Ease of use method to set premium status setting.
@@ -102,84 +184,114 @@ def account_premium_status_checks():
         """
         Notify user of expiry of debrid premium status.
         """
-        if g.get_bool_setting("general.accountNotifications"):
+        if notifications_enabled:
             g.notification(
                 f"{g.ADDON_NAME}",
-                g.get_language_string(30036).format(display_debrid_name),
+                expiry_notification.format(display_debrid_name),
             )
 
-    valid_debrid_providers = [
-        ("Real Debrid", real_debrid.RealDebrid, "rd"),
-        ("Premiumize", premiumize.Premiumize, "premiumize"),
-        ("All Debrid", all_debrid.AllDebrid, "alldebrid"),
-    ]
+    def get_account_status(name, service_module_class, prefix):
+        """
+        Fetch the account status for an enabled debrid provider.
+        """
+        # Reuse a status fetched by a recent maintenance run rather than requesting it again, it is still applied
+        cache_id = f"maintenance.accountStatus.{prefix}"
+        status = g.CACHE.get(cache_id)
+        if status == cache.CacheBase.NOT_CACHED:
+            status = service_module_class().get_account_status()
+            # An unknown status means the request failed, so leave it uncached for the next run to retry
+            if status != "unknown":
+                g.CACHE.set(cache_id, status, expiration=_ACCOUNT_STATUS_CACHE_TIME)
+        return {prefix: (name, status)}
+
+    thread_pool = ThreadPool()
+    for provider in debrid_providers:
+        # is_service_enabled is static, so disabled providers are skipped without constructing their client
+        if provider[1].is_service_enabled():
+            thread_pool.put(get_account_status, *provider)
+    account_statuses = thread_pool.wait_completion() or {}
 
-    for name, service_module_class, prefix in valid_debrid_providers:
-        service_module = service_module_class()
-        if service_module.is_service_enabled():
-            status = service_module.get_account_status()
-            if status == "expired":
-                display_expiry_notification(name)
-            g.log(f"{name}: {status}")
-            set_settings_status(prefix, status)
+    notifications_enabled = g.get_bool_setting("general.accountNotifications")
+    expiry_notification = g.get_language_string(30036)
+
+    # Only the status requests run on the pool, settings are written from the calling thread once they have completed
+    for prefix, (name, status) in account_statuses.items():
+        if status == "expired":
+            display_expiry_notification(name)
+        g.log(f"{name}: {status}")
+        set_settings_status(prefix, status)
 
 def toggle_reuselanguageinvoker(forced_state=None):
     """
     Toggle the state of reuselanguageinvoker setting in addon.xml and reload the profile.
     """
-    def _store_and_reload(output):
-        with open(file_path, "w+") as addon_xml:
-            addon_xml.writelines(output)
-        xbmcgui.Dialog().ok(g.ADDON_NAME, g.get_language_string(30531))
-        g.reload_profile()
-
     file_path = os.path.join(g.ADDON_DATA_PATH, "addon.xml")
 
-    with open(file_path) as addon_xml:
-        file_lines = addon_xml.readlines()
-
-    for i, line in enumerate(file_lines):
-        if "reuselanguageinvoker" in line:
-            if ("false" in line and forced_state is None) or ("false" in line and forced_state):
-                file_lines[i] = line.replace("false", "true")
-                g.set_setting("reuselanguageinvoker.status", "Enabled")
-                _store_and_reload(file_lines)
-            elif ("true" in line and forced_state is None) or ("true" in line and forced_state is False):
-                file_lines[i] = line.replace("true", "false")
-                g.set_setting("reuselanguageinvoker.status", "Disabled")
-                _store_and_reload(file_lines)
-            break
+    with open(file_path, "rb") as addon_xml:
+        content = addon_xml.read()
+
+    match = _REUSE_LANGUAGE_INVOKER.search(content)
+    if not match:
+        return
+
+    current_state = match.group(1) == b"true"
+    new_state = not current_state if forced_state is None else bool(forced_state)
+    if new_state == current_state:
+        return
+
+    g.set_setting("reuselanguageinvoker.status", "Enabled" if new_state else "Disabled")
+
+    # "true" and "false" differ in length so the value cannot be patched in place, the file is small so rewrite it
+    content = b"".join((content[: match.start(1)], b"true" if new_state else b"false", content[match.end(1) :]))
+
+    # Write to a temporary file and swap it in so a crash mid write cannot leave a truncated addon.xml
+    temp_file_path = f"{file_path}.tmp"
+    with open(temp_file_path, "wb") as addon_xml:
+        addon_xml.write(content)
+        addon_xml.flush()
+        os.fsync(addon_xml.fileno())
+    os.replace(temp_file_path, file_path)
+
+    xbmcgui.Dialog().ok(g.ADDON_NAME, g.get_language_string(30531))
+    g.reload_profile()
+
+def _run_safely(func, error_message):
+    """
+    Run a maintenance phase, logging rather than raising any failure so other phases are unaffected.
+    """
+    try:
+        func()
+    except Exception as e:
+        g.log(f"{error_message}: {e}", 'error')
 
 def run_maintenance():
     """
     Entry point for background maintenance cycle.
     """
+    from resources.lib.database import cache
+
     g.log("Performing Maintenance")
     # ADD COMMON HOUSE KEEPING ITEMS HERE #
 
-    # Refresh API tokens
-    try:
-        refresh_apis()
-    except Exception as e:
-        g.log(f"Failed to update API keys: {e}", 'error')
+    # Independent phases are network bound so run them concurrently
+    thread_pool = ThreadPool()
 
-    # Check account premium statuses
-    try:
-        account_premium_status_checks()
-    except Exception as e:
-        g.log(f"Failed to check account status: {e}", 'error')
+    # Refresh API tokens
+    thread_pool.put(_run_safely, refresh_apis, "Failed to update API keys")
 
     # Update provider packages and themes
-    ProviderInstallManager()
-    update_provider_packages()
-    update_themes()
+    thread_pool.put(_run_safely, update_provider_packages, "Failed to update provider packages")
+    thread_pool.put(_run_safely, update_themes, "Failed to update themes")
 
     # Check Premiumize Fair Usage for cleanup
     if g.get_bool_setting("premiumize.enabled") and g.get_bool_setting("premiumize.autodelete"):
-        try:
-            premiumize_transfer_cleanup()
-        except Exception as e:
-            g.log(f"Failed to cleanup PM transfers: {e}", 'error')
+        thread_pool.put(_run_safely, premiumize_transfer_cleanup, "Failed to cleanup PM transfers")
+
+    thread_pool.wait_completion()
+
+    # Check account premium statuses once the tokens are refreshed, writing their settings from this thread so they
+    # cannot overlap with the other phases' setting writes
+    _run_safely(account_premium_status_checks, "Failed to check account status")
 
-    # Cache cleanup
+    # Cache cleanup runs last to avoid contending with the other phases' writes
     cache.Cache().check_cleanup()
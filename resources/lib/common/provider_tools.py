@@ -1,9 +1,73 @@
+import threading
+import time
+from functools import lru_cache
+
 from resources.lib.modules.providers.settings import SettingsManager
 
+# Provider settings are read repeatedly while scraping but rarely change, so each package's settings are fetched in
+# a single query and cached for a short time
+_SETTINGS_CACHE_TTL = 60
+_settings_cache = {}
+_settings_cache_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_settings_manager():
+    """
+    Returns the shared SettingsManager instance, creating it on first use.
+
+    :return: The shared settings manager.
+    :rtype: SettingsManager
+    """
+    return SettingsManager()
+
+def clear_cache(package_name=None):
+    """
+    Clears cached provider setting values.
+
+    :param package_name: The name of the package to clear, all packages if not given.
+    :type package_name: str
+    """
+    with _settings_cache_lock:
+        if package_name is None:
+            _settings_cache.clear()
+        else:
+            _settings_cache.pop(package_name, None)
+
+def _get_cached_settings(package_name):
+    """
+    Returns the cached settings dictionary for a package, fetching it if missing or expired.
+
+    :param package_name: The name of the package.
+    :type package_name: str
+    :return: Dictionary of setting IDs to their values.
+    :rtype: dict
+    """
+    now = time.monotonic()
+    with _settings_cache_lock:
+        cached = _settings_cache.get(package_name)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    settings = _get_settings_manager().get_all_settings(package_name)
+    with _settings_cache_lock:
+        _settings_cache[package_name] = (now + _SETTINGS_CACHE_TTL, settings)
+    return settings
+
+def get_settings(package_name):
+    """
+    Retrieves all setting values for a provider package.
+
+    :param package_name: The name of the package.
+    :type package_name: str
+    :return: Dictionary of setting IDs to their values.
+    :rtype: dict
+    """
+    return dict(_get_cached_settings(package_name))
+
 def get_setting(package_name, setting_id):
     """
     Retrieves a setting value for a provider package.
-    
+
     :param package_name: The name of the package.
     :type package_name: str
     :param setting_id: The ID of the setting to retrieve.
@@ -11,13 +75,15 @@ def get_setting(package_name, setting_id):
     :return: The value of the specified setting.
     :rtype: object
     """
-    settings_manager = SettingsManager()
-    return settings_manager.get_setting(package_name, setting_id)
+    settings = _get_cached_settings(package_name)
+    if setting_id in settings:
+        return settings[setting_id]
+    return _get_settings_manager().get_setting(package_name, setting_id)
 
 def set_setting(package_name, setting_id, value):
     """
     Sets the value of a setting for a provider package.
-    
+
     :param package_name: The name of the package.
     :type package_name: str
     :param setting_id: The ID of the setting to set.
@@ -27,5 +93,6 @@ def set_setting(package_name, setting_id, value):
     :return: The value of the setting after it is set.
     :rtype: object
     """
-    settings_manager = SettingsManager()
-    return settings_manager.set_setting(package_name, setting_id, value)
+    result = _get_settings_manager().set_setting(package_name, setting_id, value)
+    clear_cache(package_name)
+    return result
@@ -1,9 +1,9 @@
 """
 Module for common utilities that may be used when working with source items.
 """
-import contextlib
 import re
 import string
+from functools import lru_cache
 
 from resources.lib.modules.globals import g
 
@@ -21,12 +21,20 @@ BROWSER_AGENTS = [
 
 # Regular expressions for cleaning and parsing titles
 _APOSTROPHE_SUBS = re.compile(r"\\'s|'s|&#039;s| 039 s")
-_SEPARATORS = re.compile(r'[:|/,!?()"[\]\-\\_.{}]|(?<![:|/,!?()"[\]\-\\_.{}\s]dd)\+')
 _WHITESPACE = re.compile(r'\s+')
-_SINGLE_QUOTE = re.compile(r"['`]")
-_AMPERSAND = re.compile(r'&#038;|&amp;|&')
-_EPISODE_NUMBERS = re.compile(r'.*((?:s\d+ ?e\d+ )|(?:season ?\d+ ?(?:episode|ep) ?\d+)|(?: \d+ ?x ?\d+ ))')
-_ASCII_NON_PRINTABLE = re.compile(fr'[^{re.escape(string.printable)}]')
+# Quotes are dropped and separators replaced with spaces in a single translate pass. Once separators are spaces a "+"
+# is kept only when it follows a standalone "dd" (dd+), and ampersands are matched in the same pass
+_SEPARATORS_AND_QUOTES = str.maketrans({**dict.fromkeys(':|/,!?()"[]-\\_.{}', " "), "'": None, "`": None})
+_PLUS_AND_AMPERSAND = re.compile(r'(?<!\sdd)\+|&#038;|&amp;|&')
+_EPISODE_NUMBERS = re.compile(r'((?:s\d+ ?e\d+ )|(?:season ?\d+ ?(?:episode|ep) ?\d+)|(?: \d+ ?x ?\d+ ))')
+# Deletion table for the ASCII characters missing from string.printable, non ASCII characters are dropped by encoding
+_ASCII_NON_PRINTABLE = str.maketrans("", "", "".join(chr(i) for i in range(128) if chr(i) not in string.printable))
+# Resolutions in order of precedence, the first found in a release title wins regardless of position
+_QUALITY_PATTERNS = (
+    ("720p", re.compile(r"72[0o]")),
+    ("1080p", re.compile(r"1[0o]8[0o]")),
+    ("4K", re.compile(r"216[0o]")),
+)
 
 # Exception for handling regex filter generation errors
 class CannotGenerateRegexFilterException(Exception):
@@ -44,24 +52,24 @@ def get_quality(release_title):
     """
     release_title = release_title.lower()
 
-    if any(q in release_title for q in ["720", "72o"]):
-        return "720p"
-    if any(q in release_title for q in ["1080", "1o80", "108o", "1o8o"]):
-        return "1080p"
-    if any(q in release_title for q in ["2160", "216o"]):
+    for quality, pattern in _QUALITY_PATTERNS:
+        if pattern.search(release_title):
+            return quality
+    # Only the first "4k" is considered and it must be followed by a non alphanumeric character
+    index = release_title.find("4k") + 2
+    if 1 < index < len(release_title) and not release_title[index].isalnum():
         return "4K"
-    with contextlib.suppress(ValueError, IndexError):
-        if not release_title[release_title.index("4k") + 2].isalnum():
-            return "4K"
     return "SD"
 
 # Structures for identifying video, audio, and other codec information
 INFO_STRUCT = {
-    "videocodec": {"AVC", "HEVC", "XVID", "DIVX", "WMV", "MP4", "MPEG", "VP9", "AV1"},
-    "hdrcodec": {"DV", "HDR", "HYBRID", "SDR"},
-    "audiocodec": {"AAC", "DTS", "DTS-HD", "DTS-HDHR", "DTS-HDMA", "DTS-X", "ATMOS", "TRUEHD", "DD+", "DD", "MP3", "WMA", "OPUS"},
-    "audiochannels": {"2.0", "5.1", "7.1"},
-    "misc": {"CAM", "HDTV", "PDTV", "REMUX", "HD-RIP", "BLURAY", "DVDRIP", "WEB", "HC", "SCR", "3D"},
+    "videocodec": frozenset({"AVC", "HEVC", "XVID", "DIVX", "WMV", "MP4", "MPEG", "VP9", "AV1"}),
+    "hdrcodec": frozenset({"DV", "HDR", "HYBRID", "SDR"}),
+    "audiocodec": frozenset(
+        {"AAC", "DTS", "DTS-HD", "DTS-HDHR", "DTS-HDMA", "DTS-X", "ATMOS", "TRUEHD", "DD+", "DD", "MP3", "WMA", "OPUS"}
+    ),
+    "audiochannels": frozenset({"2.0", "5.1", "7.1"}),
+    "misc": frozenset({"CAM", "HDTV", "PDTV", "REMUX", "HD-RIP", "BLURAY", "DVDRIP", "WEB", "HC", "SCR", "3D"}),
 }
 
 def info_set_to_dict(info_set):
@@ -73,7 +81,7 @@ def info_set_to_dict(info_set):
     :return: Structured dictionary of the info set.
     :rtype: dict
     """
-    return {info_prop: sorted(list(info_set & codecs)) for info_prop, codecs in INFO_STRUCT.items()}
+    return {info_prop: sorted(codecs.intersection(info_set)) for info_prop, codecs in INFO_STRUCT.items()}
 
 # Mapping of codec types to possible keywords in release titles
 INFO_TYPES = {
@@ -127,6 +135,12 @@ INFO_TYPES = {
     "3D": [" 3d"],
 }
 
+# One alternation per info type so each type is found with a single scan of the title. A single union of every token
+# cannot be used as matches do not overlap and some tokens, such as "hcts", belong to more than one type
+_INFO_TYPE_PATTERNS = {
+    info_prop: re.compile("|".join(re.escape(i) for i in string_list)) for info_prop, string_list in INFO_TYPES.items()
+}
+
 def get_info(release_title):
     """
     Identifies and retrieves a list of information based on release title of source.
@@ -137,7 +151,7 @@ def get_info(release_title):
     :rtype: set
     """
     title = f"{clean_title(release_title)} "
-    info = {info_prop for info_prop, string_list in INFO_TYPES.items() if any(i in title for i in string_list)}
+    info = {info_prop for info_prop, pattern in _INFO_TYPE_PATTERNS.items() if pattern.search(title)}
     if all(i in info for i in ["SDR", "HDR"]):
         info.remove("HDR")
     elif all(i in title for i in ["2160p", "remux"]) and all(i not in info for i in ["HDR", "SDR"]):
@@ -171,17 +185,32 @@ def strip_non_ascii_and_unprintable(text):
     :return: Cleaned text.
     :rtype: str
     """
-    return _ASCII_NON_PRINTABLE.sub("", text)
+    text = text.encode("ascii", "ignore").decode("ascii")
+    # isprintable is only False here for control characters, which release titles rarely contain
+    return text if text.isprintable() else text.translate(_ASCII_NON_PRINTABLE)
+
+def _replace_plus_or_ampersand(match):
+    """
+    Replacement for _PLUS_AND_AMPERSAND matches, separating on "+" and spelling out ampersands.
 
+    :param match: The match to replace.
+    :type match: re.Match
+    :return: The replacement string.
+    :rtype: str
+    """
+    return " " if match.group() == "+" else "and"
+
+@lru_cache(maxsize=8192)
 def clean_title(title, broken=None):
     """
     Returns a cleaned version of the provided title.
+    Results are cached as the same titles are cleaned repeatedly while filtering sources.
     
     :param title: Title to be cleaned.
     :type title: str
     :param broken: Set to 1 to remove apostrophes, 2 to replace with spaces.
     :type broken: int, optional
-    :return: Cleaned title.
+    :return: Cleaned title, always lowercase so callers do not need to lower it again.
     :rtype: str
     """
     title = g.deaccent_string(title)
@@ -195,12 +224,10 @@ def clean_title(title, broken=None):
         apostrophe_replacement = " s"
 
     title = _APOSTROPHE_SUBS.sub(apostrophe_replacement, title)
-    title = _SINGLE_QUOTE.sub("", title)
-    title = _SEPARATORS.sub(" ", title)
-    title = _WHITESPACE.sub(" ", title)
-    title = _AMPERSAND.sub("and", title)
+    title = title.translate(_SEPARATORS_AND_QUOTES)
+    title = _PLUS_AND_AMPERSAND.sub(_replace_plus_or_ampersand, title)
 
-    return title.strip()
+    return " ".join(title.split())
 
 def remove_from_title(title, target, clean=True):
     """
@@ -218,16 +245,15 @@ def remove_from_title(title, target, clean=True):
     if not target:
         return title
 
-    title = title.replace(f" {str(target).lower()} ", " ")
-    title = title.replace(f".{str(target).lower()}.", " ")
-    title = title.replace(f"+{str(target).lower()}+", " ")
-    title = title.replace(f"-{str(target).lower()}-", " ")
+    target = str(target).lower()
+    for separator in " .+-":
+        title = title.replace(f"{separator}{target}{separator}", " ")
     if clean:
         title = f"{clean_title(title)} "
     else:
         title += " "
 
-    return re.sub(r"\s+", " ", title)
+    return _WHITESPACE.sub(" ", title)
 
 def remove_country(title, country, clean=True):
     """
@@ -246,7 +272,7 @@ def remove_country(title, country, clean=True):
     if title is None or country is None:
         return title
 
-    if isinstance(country, (list, set)):
+    if isinstance(country, (list, set, tuple)):
         for c in country:
             title = _remove_country(clean, c.lower(), title)
     else:
@@ -303,6 +329,18 @@ def _get_regex_pattern(titles, suffixes_list, non_escaped_suffixes=None):
     pattern = f"{pattern[:-1]})+"
     return re.compile(pattern)
 
+def _get_title_prefixes(titles):
+    """
+    Builds the title prefixes a release title must start with to match a pattern built by _get_regex_pattern.
+    Checking these with startswith rejects unrelated release titles without running the full pattern.
+
+    :param titles: List of titles to match.
+    :type titles: list
+    :return: Tuple of title prefixes.
+    :rtype: tuple
+    """
+    return tuple(f"{title} " for title in (title.strip() for title in titles) if title)
+
 def check_title_match(title_parts, release_title, simple_info):
     """
     Performs cleaning of title and attempts to do a simple matching of title.
@@ -316,14 +354,60 @@ def check_title_match(title_parts, release_title, simple_info):
     :return: True if the title matches, else False.
     :rtype: bool
     """
-    title = f"{clean_title(' '.join(title_parts))} "
+    title = _get_title_match_prefix(' '.join(title_parts), _get_country_key(simple_info), simple_info.get("year", ""))
+    return release_title.startswith(title)
+
+def _get_country_key(simple_info):
+    """
+    Returns the country of the item in a form that can be used as a cache key.
 
+    :param simple_info: Simplified metadata of the item.
+    :type simple_info: dict
+    :return: The country, with lists and sets of countries converted to tuples.
+    :rtype: str | tuple
+    """
     country = simple_info.get("country", "")
-    year = simple_info.get("year", "")
+    if isinstance(country, (list, set)):
+        country = tuple(country)
+    return country
+
+@lru_cache(maxsize=1024)
+def _get_title_match_prefix(title, country, year):
+    """
+    Cleans a title and strips the country and year from it, giving the prefix a matching release title starts with.
+    Cached as the same titles and aliases are prepared for every filter built for an item.
+
+    :param title: Title to build the prefix from.
+    :type title: str
+    :param country: Country of the item.
+    :type country: str | list | tuple
+    :param year: Year of the item.
+    :type year: str
+    :return: Release title prefix.
+    :rtype: str
+    """
+    title = f"{clean_title(title)} "
     title = remove_country(title, country)
-    title = remove_from_title(title, year)
+    return remove_from_title(title, year)
 
-    return release_title.startswith(title)
+@lru_cache(maxsize=256)
+def _get_movie_title_prefixes(movie_title, country, year):
+    """
+    Builds the release title prefixes for a movie, covering each way apostrophes may have been cleaned.
+    These only depend on the movie, so they are cached rather than rebuilt for every release being filtered.
+
+    :param movie_title: Title of the movie.
+    :type movie_title: str
+    :param country: Country of the movie.
+    :type country: str | tuple
+    :param year: Year of the movie.
+    :type year: str
+    :return: Release title prefixes.
+    :rtype: tuple
+    """
+    return tuple(
+        _get_title_match_prefix(clean_title(movie_title, broken=broken), country, year) for broken in (None, 1, 2)
+    )
 
 def check_episode_number_match(release_title):
     """
@@ -334,7 +418,12 @@ def check_episode_number_match(release_title):
     :return: True if present, else False.
     :rtype: bool
     """
-    return _EPISODE_NUMBERS.match(release_title) is not None
+    # Every episode number form contains an "s" (s01e01, season) or an "x" (1x01)
+    if "s" not in release_title and "x" not in release_title:
+        return False
+    match = _EPISODE_NUMBERS.search(release_title)
+    # Only the first line of the title is considered
+    return match is not None and release_title.find("\n", 0, match.start()) == -1
 
 def check_episode_title_match(show_titles, release_title, simple_info):
     """
@@ -353,9 +442,7 @@ def check_episode_title_match(show_titles, release_title, simple_info):
     if simple_info.get("episode_title", None) is not None:
         episode_title = clean_title(simple_info["episode_title"])
         if len(episode_title.split(" ")) >= 3 and episode_title in release_title:
-            for title in show_titles:
-                if release_title.startswith(clean_title(title)):
-                    return True
+            return release_title.startswith(tuple(clean_title(title) for title in show_titles))
     return False
 
 def filter_movie_title(org_release_title, release_title, movie_title, simple_info):
@@ -387,14 +474,7 @@ def filter_movie_title(org_release_title, release_title, movie_title, simple_inf
     if check_episode_number_match(release_title):
         return False
 
-    title_broken_1 = clean_title(movie_title, broken=1)
-    title_broken_2 = clean_title(movie_title, broken=2)
-
-    return (
-        check_title_match([title], release_title, simple_info)
-        or check_title_match([title_broken_1], release_title, simple_info)
-        or check_title_match([title_broken_2], release_title, simple_info)
-    )
+    return release_title.startswith(_get_movie_title_prefixes(movie_title, _get_country_key(simple_info), year))
 
 def clean_title_with_simple_info(title, simple_info):
     """
@@ -407,13 +487,8 @@ def clean_title_with_simple_info(title, simple_info):
     :return: Cleaned title.
     :rtype: str
     """
-    title = f"{clean_title(title)} "
-    country = simple_info.get("country", "")
-    title = remove_country(title, country)
-    year = simple_info.get("year", "")
-    title = remove_from_title(title, year)
-    title = _WHITESPACE.sub(" ", title)
-    return title.rstrip()
+    title = _get_title_match_prefix(title, _get_country_key(simple_info), simple_info.get("year", ""))
+    return _WHITESPACE.sub(" ", title).rstrip()
 
 def get_filter_single_episode_fn(simple_info):
     """
@@ -501,6 +576,7 @@ def get_filter_season_pack_fn(simple_info):
         season_full_fill_check,
     ]
     regex_pattern = _get_regex_pattern(clean_titles, suffixes)
+    title_prefixes = _get_title_prefixes(clean_titles)
 
     def filter_fn(release_title):
         """
@@ -511,11 +587,14 @@ def get_filter_season_pack_fn(simple_info):
         :return: True if a match is found, else False.
         :rtype: bool
         """
+        if not release_title.startswith(title_prefixes):
+            return False
+
         episode_number_match = check_episode_number_match(release_title)
         if episode_number_match:
             return False
 
-        return bool(re.match(regex_pattern, release_title))
+        return regex_pattern.match(release_title) is not None
 
     return filter_fn
 
@@ -668,6 +747,7 @@ def get_filter_show_pack_fn(simple_info):
     ]
 
     regex_pattern = _get_regex_pattern(titles, suffixes, non_escaped_suffixes=non_escaped_suffixes)
+    title_prefixes = _get_title_prefixes(titles)
 
     def filter_fn(release_title):
         """
@@ -678,11 +758,14 @@ def get_filter_show_pack_fn(simple_info):
         :return: True if a match is found, else False.
         :rtype: bool
         """
+        if not release_title.startswith(title_prefixes):
+            return False
+
         episode_number_match = check_episode_number_match(release_title)
         if episode_number_match:
             return False
 
-        return bool(re.match(regex_pattern, release_title))
+        return regex_pattern.match(release_title) is not None
 
     return filter_fn
 
@@ -707,15 +790,43 @@ def _full_meta_episode_regex(args):
     :rtype: re.Pattern
     """
     episode_info = args["info"]
-    show_title = clean_title(episode_info["tvshowtitle"])
     country = episode_info.get("country", "")
     if isinstance(country, (list, set)):
         country = '|'.join(country)
+
+    return _compile_episode_regex(
+        episode_info["tvshowtitle"],
+        country,
+        episode_info.get("year", ""),
+        episode_info.get("title", ""),
+        str(episode_info.get("season", "")),
+        str(episode_info.get("episode", "")),
+    )
+
+@lru_cache(maxsize=256)
+def _compile_episode_regex(show_title, country, year, episode_title, season, episode):
+    """
+    Builds and compiles the episode title matching regex from an episode item's metadata.
+    Cached so that repeated resolving passes over the same item do not rebuild the pattern.
+
+    :param show_title: Title of the show.
+    :type show_title: str
+    :param country: Country of the show, with multiple countries joined by "|".
+    :type country: str
+    :param year: Year of the show.
+    :type year: str
+    :param episode_title: Title of the episode.
+    :type episode_title: str
+    :param season: Season number.
+    :type season: str
+    :param episode: Episode number.
+    :type episode: str
+    :return: Compiled regex object.
+    :rtype: re.Pattern
+    """
+    show_title = clean_title(show_title)
     country = country.lower()
-    year = episode_info.get("year", "")
-    episode_title = clean_title(episode_info.get("title", ""))
-    season = str(episode_info.get("season", ""))
-    episode = str(episode_info.get("episode", ""))
+    episode_title = clean_title(episode_title)
 
     if episode_title == show_title or len(re.findall(r"^\d+$", episode_title)) > 0:
         episode_title = None
@@ -745,6 +856,31 @@ def _full_meta_episode_regex(args):
 
     return re.compile(reg_string)
 
+@lru_cache(maxsize=1024)
+def _get_clean_file_name(path):
+    """
+    Returns the cleaned file name of a source file path.
+    Cached as the same paths are normalised by each resolving filter they pass through.
+
+    :param path: Path of the source file.
+    :type path: str
+    :return: Cleaned file name.
+    :rtype: str
+    """
+    return clean_title(path.split("/")[-1].replace("&", " "))
+
+@lru_cache(maxsize=1024)
+def _get_lowered_folder_names(path):
+    """
+    Returns the lowered names of each part of a source file path.
+
+    :param path: Path of the source file.
+    :type path: str
+    :return: Set of lowered path part names.
+    :rtype: frozenset
+    """
+    return frozenset(folder.lower() for folder in path.split("/"))
+
 def get_best_episode_match(dict_key, dictionary_list, item_information):
     """
     Attempts to identify the best matching file(s) for a given item and list of source files.
@@ -759,19 +895,18 @@ def get_best_episode_match(dict_key, dictionary_list, item_information):
     :rtype: dict
     """
     regex = _full_meta_episode_regex(item_information)
-    files = []
+    best_match = None
+    best_score = -1
 
     for i in dictionary_list:
-        i.update({"regex_matches": regex.findall(clean_title(i[dict_key].split("/")[-1].replace("&", " ").lower()))})
-        files.append(i)
-    files = [i for i in files if len(i["regex_matches"]) > 0]
-
-    if not files:
-        return None
+        # Score is the length of all matches joined by spaces, totalled without building the match list
+        score = -1
+        for match in regex.finditer(_get_clean_file_name(i[dict_key])):
+            score += len(match.group()) + 1
+        if score > best_score:
+            best_match, best_score = i, score
 
-    files = sorted(files, key=lambda x: len(" ".join(x["regex_matches"])), reverse=True)
-
-    return files[0]
+    return best_match
 
 def clear_extras_by_string(args, extra_string, folder_details):
     """
@@ -786,27 +921,45 @@ def clear_extras_by_string(args, extra_string, folder_details):
     :return: Cleaned list of folder items.
     :rtype: list
     """
+    return _clear_extras_by_strings(args, (extra_string,), folder_details)
+
+def _clear_extras_by_strings(args, extra_strings, folder_details):
+    """
+    Strips source files containing any of the given extras strings in a single pass over the files.
+
+    :param args: Full metadata of the requested playback item.
+    :type args: dict
+    :param extra_strings: Strings used to identify bad source files.
+    :type extra_strings: tuple
+    :param folder_details: Normalized list of source files.
+    :type folder_details: list
+    :return: Cleaned list of folder items.
+    :rtype: list
+    """
     keys_to_confirm_against = ["title", "tvshowtitle"]
     if int(args["info"].get("season", 1)) == 0:
         return folder_details
-    for key in keys_to_confirm_against:
-        if extra_string in args["info"].get(key, ""):
-            return []
+    for extra_string in extra_strings:
+        for key in keys_to_confirm_against:
+            if extra_string in args["info"].get(key, ""):
+                return []
+
+    extra_folders = {extra_string.lower() for extra_string in extra_strings}
+
+    def is_not_extra(item):
+        path = item["path"]
+        file_name = _get_clean_file_name(path)
+        return extra_folders.isdisjoint(_get_lowered_folder_names(path)) and not any(
+            extra_string in file_name or extra_string in path for extra_string in extra_strings
+        )
 
-    folder_details = [
-        i for i in folder_details if extra_string not in clean_title(i["path"].split("/")[-1].replace("&", " ").lower())
-    ]
-    folder_details = [
-        i
-        for i in folder_details
-        if not any(True for folder in i["path"].split("/") if extra_string.lower() == folder.lower())
-    ]
+    return [i for i in folder_details if is_not_extra(i)]
 
-    return [i for i in folder_details if extra_string not in i["path"]]
+_EXTRA_STRINGS = ("extras", "specials", "featurettes", "deleted scenes", "sample")
 
 def filter_files_for_resolving(folder_details, args):
     """
-    Ease of use method to filter common strings with clear_extras_by_string.
+    Ease of use method to filter common extras strings from the source files in a single pass.
     
     :param folder_details: Normalized list of source files.
     :type folder_details: list
@@ -815,12 +968,17 @@ def filter_files_for_resolving(folder_details, args):
     :return: Cleaned list of folder items.
     :rtype: list
     """
-    folder_details = clear_extras_by_string(args, "extras", folder_details)
-    folder_details = clear_extras_by_string(args, "specials", folder_details)
-    folder_details = clear_extras_by_string(args, "featurettes", folder_details)
-    folder_details = clear_extras_by_string(args, "deleted scenes", folder_details)
-    folder_details = clear_extras_by_string(args, "sample", folder_details)
-    return folder_details
+    return _clear_extras_by_strings(args, _EXTRA_STRINGS, folder_details)
+
+# Size units in the order they are checked for with their multiplier to MB, None for units that are already MB
+_SIZE_UNITS = (
+    ("GB", 1024),
+    ("MB", None),
+    ("KB", 0.001),
+    ("MiB", None),
+    ("GiB", 1024),
+    ("KiB", 0.001024),
+)
 
 def de_string_size(size):
     """
@@ -831,34 +989,25 @@ def de_string_size(size):
     :return: Size in MB if the string can be converted, else None.
     :rtype: int | None
     """
-    if "GB" in size:
-        size = float(size.replace("GB", ""))
-        return int(size * 1024)
-    if "MB" in size:
-        size = int(size.replace("MB", "").replace(" ", "").split(".")[0])
-        return size
-    if "KB" in size:
-        size = float(size.replace("KB", ""))
-        return int(size * 0.001)
-    if "MiB" in size:
-        size = int(size.replace("MiB", "").replace(" ", "").split(".")[0])
-        return size
-    if "GiB" in size:
-        size = float(size.replace("GiB", ""))
-        return int(size * 1024)
-    if "KiB" in size:
-        size = float(size.replace("KiB", ""))
-        return int(size * 0.001024)
+    for unit, multiplier in _SIZE_UNITS:
+        if unit in size:
+            size = size.replace(unit, "")
+            if multiplier is None:
+                # Sizes already in MB are truncated rather than parsed as floats
+                return int(size.replace(" ", "").split(".")[0])
+            return int(float(size) * multiplier)
+
+# Resolutions from highest to lowest, indexed by the maxResolution and minResolution settings
+_RESOLUTIONS = ("4K", "1080p", "720p", "SD")
 
 def get_accepted_resolution_set():
     """
     Fetches a set of accepted resolutions per settings.
     
     :return: Set of resolutions.
-    :rtype: set
+    :rtype: frozenset
     """
-    resolutions = ["4K", "1080p", "720p", "SD"]
     max_res = g.get_int_setting("general.maxResolution")
     min_res = g.get_int_setting("general.minResolution")
 
-    return set(resolutions[max_res : min_res + 1])
+    return frozenset(_RESOLUTIONS[max_res : min_res + 1])
@@ -1,9 +1,97 @@
 import concurrent.futures
-from functools import reduce
+import threading
+import time
+from collections.abc import Mapping
+from itertools import repeat
 from resources.lib.common import tools
 from resources.lib.modules.globals import g
 
 
+def _copy_non_empty(dictionary):
+    """
+    Copies a dictionary without its empty values, as smart_merge_dictionary does when merging it into a new key.
+
+    :param dictionary: Dictionary to copy.
+    :type dictionary: dict
+    :return: Copy of the dictionary with empty values removed.
+    :rtype: dict
+    """
+    result = {}
+    for key, value in dictionary.items():
+        if isinstance(value, dict):
+            value = _copy_non_empty(value)
+        elif isinstance(value, Mapping):
+            continue
+        if value or value == 0 or isinstance(value, bool):
+            result[key] = value
+    return result
+
+
+def _merge_result_dictionary(dictionary, merge_dict):
+    """
+    Merges a task result into the accumulated results in place.
+    Only keys already present are merged with smart_merge_dictionary, new keys are added directly rather than paying
+    for its deep copies.
+
+    :param dictionary: Accumulated results to merge into.
+    :type dictionary: dict
+    :param merge_dict: Task result to merge.
+    :type merge_dict: dict
+    :return: The accumulated results.
+    :rtype: dict
+    """
+    if not isinstance(merge_dict, dict):
+        return dictionary
+    for key, value in merge_dict.items():
+        if key in dictionary:
+            tools.smart_merge_dictionary(dictionary, {key: value})
+            continue
+        if isinstance(value, dict):
+            value = _copy_non_empty(value)
+        elif isinstance(value, Mapping):
+            continue
+        if value or value == 0 or isinstance(value, bool):
+            dictionary[key] = value
+    return dictionary
+
+
+def _run_chunk(func, chunk):
+    """
+    Runs func for each set of arguments in a chunk on the calling worker thread.
+
+    :param func: The function to execute.
+    :type func: callable
+    :param chunk: A list of (args, kwargs) tuples.
+    :type chunk: list
+    :return: The results for the chunk in order.
+    :rtype: list
+    """
+    return [func(*args, **kwargs) for args, kwargs in chunk]
+
+
+def _run_batch(batch_func, items, futures):
+    """
+    Runs batch_func once for a batch of items and resolves each item's future with its result.
+
+    :param batch_func: The function to execute, taking a list of items and returning a list of results in order.
+    :type batch_func: callable
+    :param items: The items of the batch.
+    :type items: list
+    :param futures: The futures of the items, in the same order.
+    :type futures: list
+    """
+    try:
+        results = batch_func(items)
+        if len(results) != len(futures):
+            raise ValueError(f"Batch function returned {len(results)} results for {len(futures)} items")
+    except Exception as e:
+        for future in futures:
+            future.set_exception(e)
+        return
+    for future, result in zip(futures, results):
+        future.set_result(result)
+
+
 class ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
     """
     Extends the ThreadPoolExecutor to support cancelling futures on shutdown.
@@ -51,11 +139,27 @@ class ThreadPool:
         self.limiter = g.get_bool_runtime_setting("threadpool.limiter")
         self.workers = self.scaled_workers[g.get_int_setting("general.threadpoolScale", -1) + 1]
         self.max_workers = 1 if self.limiter else self.workers
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._executor = None
         self.tasks = []
+        self._batches = {}
+        self._batches_lock = threading.Lock()
 
     def __del__(self):
-        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def executor(self):
+        """
+        The executor running the tasks, created on first submission so that pools which never run anything cost
+        nothing. Worker threads are then started by the executor as tasks are submitted, up to max_workers.
+
+        :return: The executor.
+        :rtype: ThreadPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
 
     @staticmethod
     def _handle_results(results):
@@ -74,7 +178,10 @@ class ThreadPool:
             return None
 
         if isinstance(result, dict):
-            return reduce(tools.smart_merge_dictionary, result_iter, result)
+            for merge_result in result_iter:
+                if merge_result is not None:
+                    _merge_result_dictionary(result, merge_result)
+            return result
         elif isinstance(result, (list, set)):
             result_list = list(result)
             for result in result_iter:
@@ -98,45 +205,127 @@ class ThreadPool:
         """
         self.tasks.append(self.executor.submit(func, *args, **kwargs))
 
+    def put_batched(self, batch_func, item, key=None, max_batch=64, max_delay_ms=5):
+        """
+        Adds an item to be processed together with the other items put for the same key in a single call to
+        batch_func. A batch is submitted once it holds max_batch items, when an item is put more than max_delay_ms
+        after its first item, or when wait_completion is called, whichever comes first. Batches are always submitted
+        from the calling thread so no thread is started to wait on them.
+
+        :param batch_func: The function to run as a task, taking a list of items and returning a list of results in
+                           the same order.
+        :type batch_func: callable
+        :param item: The item to add to the batch.
+        :param key: Key of the batch to add the item to, batch_func if not given.
+        :type key: hashable
+        :param max_batch: Maximum number of items in a batch.
+        :type max_batch: int
+        :param max_delay_ms: Maximum time in milliseconds to keep adding items to a batch before submitting it.
+        :type max_delay_ms: int
+        """
+        key = batch_func if key is None else key
+        future = concurrent.futures.Future()
+        now = time.monotonic()
+
+        with self._batches_lock:
+            batch = self._batches.get(key)
+            if batch is not None and now >= batch[3]:
+                # The batch has waited long enough, submit it as is and start a new one with this item
+                self._batches.pop(key)
+                expired, batch = batch, None
+            else:
+                expired = None
+            if batch is None:
+                batch = self._batches[key] = (batch_func, [], [], now + max_delay_ms / 1000)
+            batch[1].append(item)
+            batch[2].append(future)
+            full = len(batch[1]) >= max_batch
+            if full:
+                self._batches.pop(key)
+
+        self.tasks.append(future)
+        if expired is not None:
+            self._submit_batch(expired)
+        if full:
+            self._submit_batch(batch)
+
+    def _submit_batch(self, batch):
+        """
+        Submits a batch removed from the pending batches to the executor.
+
+        :param batch: The batch to submit.
+        :type batch: tuple
+        """
+        batch_func, items, futures, _ = batch
+        try:
+            self.executor.submit(_run_batch, batch_func, items, futures)
+        except Exception as e:
+            # The futures are already in the tasks, so fail them for wait_completion to raise rather than leave them
+            for future in futures:
+                future.set_exception(e)
+
     def wait_completion(self):
         """
         Waits for the completion of all tasks, raises any exceptions if present, and returns the results.
 
         :return: The results of all tasks.
-        :raises: The first exception raised if any task fails.
+        :raises: The exception of the first failed task in submission order.
         """
+        with self._batches_lock:
+            batches, self._batches = self._batches, {}
+        for batch in batches.values():
+            self._submit_batch(batch)
+
+        # Detach the batch so that tasks put from here on start a new one and finished futures are released with it
+        tasks, self.tasks = self.tasks, []
         try:
-            for task in concurrent.futures.as_completed(self.tasks):
-                if exception := task.exception():
-                    self.executor.shutdown(wait=False, cancel_futures=True)
-                    raise exception
-
-            results = self._handle_results(task.result() for task in self.tasks if task)
-            self.tasks.clear()
-            return results
+            # result() blocks in submission order and re-raises a task's exception directly
+            return self._handle_results(task.result() for task in tasks)
         except Exception:
             g.log_stacktrace()
-            self.executor.shutdown(wait=False, cancel_futures=True)
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
             raise
 
-    def map_results(self, func, args_iterable=None, kwargs_iterable=None):
+    def _chunked_map(self, func, args_iterable, kwargs_iterable, chunksize=None):
+        """
+        Submits the calls in chunks, one future per chunk, and yields their results in order.
+
+        :param func: The function to execute.
+        :param args_iterable: An iterable of argument tuples.
+        :param kwargs_iterable: An iterable of keyword argument dictionaries.
+        :param chunksize: Number of calls per submitted chunk, sized from the number of workers if not given.
+        :return: Generator of the results.
+        """
+        if not args_iterable and not kwargs_iterable:
+            return
+        items = list(zip(args_iterable or repeat(()), kwargs_iterable or repeat({})))
+        if len(items) <= 1 or self.max_workers == 1:
+            # A single worker, or a single call, would run one after another while this thread waits, so run them here
+            yield from _run_chunk(func, items)
+            return
+        if not chunksize:
+            chunksize = max(1, len(items) // (self.max_workers * 4))
+        futures = [
+            self.executor.submit(_run_chunk, func, items[i : i + chunksize]) for i in range(0, len(items), chunksize)
+        ]
+        for future in futures:
+            yield from future.result()
+
+    def map_results(self, func, args_iterable=None, kwargs_iterable=None, chunksize=None):
         """
         Takes iterables for args and kwargs, runs func with them, gathers the results, and returns them in order.
 
         :param func: The function to execute.
         :param args_iterable: An iterable of argument tuples.
         :param kwargs_iterable: An iterable of keyword argument dictionaries.
+        :param chunksize: Number of calls to run per submitted task, sized from the number of workers if not given.
         :return: The results.
         """
         try:
-            return self._handle_results(
-                self.executor.map(lambda args, kwargs: func(*args, **kwargs), args_iterable, kwargs_iterable)
-                if args_iterable and kwargs_iterable
-                else self.executor.map(lambda kwargs: func(**kwargs), kwargs_iterable)
-                if kwargs_iterable
-                else self.executor.map(lambda args: func(*args), args_iterable)
-            )
+            return self._handle_results(self._chunked_map(func, args_iterable, kwargs_iterable, chunksize))
         except Exception:
-            self.executor.shutdown(wait=False, cancel_futures=True)
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
             g.log_stacktrace()
             raise
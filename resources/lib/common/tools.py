@@ -481,6 +481,17 @@ def translate_path(path):
     return path
 
 
+def is_local_path(path):
+    """
+    Checks if a translated path is on the local filesystem rather than a Kodi VFS share (smb://, nfs:// etc).
+    :param path: Translated path to check.
+    :type path: str
+    :return: True if the path can be handled with native filesystem calls.
+    :rtype: bool
+    """
+    return "://" not in path
+
+
 def create_multiline_message(line1=None, line2=None, line3=None, *lines):
     """
     Creates a message from the supplied lines.
@@ -15,13 +15,23 @@ class MySQLCursorDict(mysql.connector.connection.MySQLCursor):
 
     ERR_NO_RESULT_TO_FETCH = "No result set to fetch from"
 
+    _column_names = ()
+
+    def _handle_result(self, result):
+        """
+        Handle the result after a command was sent, caching the column names of a new result set.
+        """
+        super()._handle_result(result)
+        # column_names is rebuilt from the description on each access, so read it once per result set
+        self._column_names = self.column_names
+
     def _row_to_python(self, rowdata):
         """
         Convert a MySQL text result row to Python types.
 
         Returns a dictionary.
         """
-        return dict(zip(self.column_names, rowdata)) if rowdata else None
+        return dict(zip(self._column_names, rowdata)) if rowdata else None
 
     def fetchone(self):
         """
@@ -32,6 +42,35 @@ class MySQLCursorDict(mysql.connector.connection.MySQLCursor):
             return self._row_to_python(row)
         return None
 
+    def fetchmany(self, size=None):
+        """
+        Returns the next set of rows of a query result set as a list of dictionaries.
+        Up to size rows, or arraysize if not given, are read from the connection in one call rather than row by row.
+        """
+        if not self._have_unread_result():
+            return []
+
+        count = size or self.arraysize
+        rows = []
+        if self._nextrow[0]:
+            rows.append(self._nextrow[0])
+            self._nextrow = (None, None)
+            count -= 1
+        if count > 0:
+            fetched_rows, eof = self._connection.get_rows(count=count)
+            rows.extend(fetched_rows)
+            if eof:
+                self._handle_eof(eof)
+
+        column_names = self._column_names
+        result = [dict(zip(column_names, row)) for row in rows]
+
+        if self._rowcount == -1:
+            self._rowcount = 0
+        self._rowcount += len(rows)
+
+        return result
+
     def fetchall(self):
         """
         Returns all rows of a query result set as a list of dictionaries.
@@ -44,7 +83,8 @@ class MySQLCursorDict(mysql.connector.connection.MySQLCursor):
         if self._nextrow[0]:
             rows.insert(0, self._nextrow[0])
         
-        result = [self._row_to_python(row) for row in rows]
+        column_names = self._column_names
+        result = [dict(zip(column_names, row)) for row in rows]
         
         self._handle_eof(eof)
         rowcount = len(rows)
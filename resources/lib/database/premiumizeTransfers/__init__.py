@@ -52,3 +52,14 @@ class PremiumizeTransfers(Database):
         :rtype: None
         """
         self.execute_sql("DELETE FROM transfers WHERE transfer_id=?", (transfer_id,))
+
+    def remove_premiumize_transfers(self, transfer_ids):
+        """
+        Removes multiple transfers from the database with a single statement
+        :param transfer_ids: IDs of transfers from Premiumize
+        :type transfer_ids: list
+        :return: None
+        :rtype: None
+        """
+        placeholders = ",".join("?" for _ in transfer_ids)
+        self.execute_sql(f"DELETE FROM transfers WHERE transfer_id IN ({placeholders})", tuple(transfer_ids))
@@ -9,6 +9,7 @@ import xbmcgui
 from resources.lib.common import tools
 from resources.lib.database.cache import use_cache
 from resources.lib.modules.globals import g
+from resources.lib.modules.http_session import get_session
 
 AD_AUTH_KEY = "alldebrid.apikey"
 AD_ENABLED_KEY = "alldebrid.enabled"
@@ -65,14 +66,7 @@ class AllDebrid:
 
     @cached_property
     def session(self):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3 import Retry
-
-        session = requests.Session()
-        retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[429, 500, 502, 503, 504])
-        session.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=100))
-        return session
+        return get_session("all_debrid", total=5, backoff_factor=0.1, status_forcelist=[429, 500, 502, 503, 504])
 
     @alldebrid_guard_response
     def get(self, url, **params):
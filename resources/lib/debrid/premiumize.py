@@ -13,6 +13,7 @@ from resources.lib.common import tools
 from resources.lib.database.cache import use_cache
 from resources.lib.database.premiumizeTransfers import PremiumizeTransfers
 from resources.lib.modules.globals import g
+from resources.lib.modules.http_session import get_session
 
 PM_TOKEN_KEY = "premiumize.token"
 
@@ -33,14 +34,7 @@ class Premiumize:
 
     @cached_property
     def session(self):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3 import Retry
-
-        session = requests.Session()
-        retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-        session.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=100))
-        return session
+        return get_session("premiumize", total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
 
     @staticmethod
     def _error_handler(request):
@@ -12,6 +12,8 @@ from resources.lib.modules.exceptions import RanOnceAlready
 from resources.lib.modules.exceptions import UnexpectedResponse
 from resources.lib.modules.global_lock import GlobalLock
 from resources.lib.modules.globals import g
+from resources.lib.modules.http_session import get_session
+from resources.lib.modules.single_flight import coalesce_token_refresh
 
 RD_AUTH_KEY = "rd.auth"
 RD_STATUS_KEY = "rd.premiumstatus"
@@ -38,14 +40,7 @@ class RealDebrid:
 
     @cached_property
     def session(self):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3 import Retry
-
-        session = requests.Session()
-        retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-        session.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=100))
-        return session
+        return get_session("real_debrid", total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
 
     def _auth_loop(self):
         url = f"client_id={RD_AUTH_CLIENT_ID}&code={self.device_code}"
@@ -154,6 +149,7 @@ class RealDebrid:
         self._handle_error(response)
         return False
 
+    @coalesce_token_refresh
     def try_refresh_token(self, force=False):
         if not self.refresh:
             return
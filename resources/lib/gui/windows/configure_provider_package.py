@@ -1,5 +1,6 @@
 import xbmcgui
 
+from resources.lib.common import provider_tools
 from resources.lib.database.providerCache import ProviderCache
 from resources.lib.gui.windows.base_window import BaseWindow
 from resources.lib.modules.globals import g
@@ -168,6 +169,7 @@ class PackageConfiguration(BaseWindow):
                     setting["id"],
                     self.manager.settings_template[setting["type"]]["cast"](value),
                 )
+                provider_tools.clear_cache(self.package_name)
                 self.update_settings()
             except TypeError:
                 xbmcgui.Dialog().ok(g.ADDON_NAME, "The setting value was invalid")
@@ -10,6 +10,7 @@ from resources.lib.database.cache import use_cache
 from resources.lib.indexers.apibase import ApiBase
 from resources.lib.indexers.apibase import handle_single_item_or_list
 from resources.lib.modules.globals import g
+from resources.lib.modules.http_session import get_session
 
 
 def fanart_guard_response(func):
@@ -91,14 +92,7 @@ class FanartTv(ApiBase):
 
     @cached_property
     def session(self):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3 import Retry
-
-        session = requests.Session()
-        retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-        session.mount('https://', HTTPAdapter(max_retries=retries, pool_maxsize=100))
-        return session
+        return get_session("fanarttv", total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
 
     @staticmethod
     def build_image(url, art, image):
@@ -10,6 +10,7 @@ from resources.lib.database.cache import use_cache
 from resources.lib.indexers.apibase import ApiBase
 from resources.lib.indexers.apibase import handle_single_item_or_list
 from resources.lib.modules.globals import g
+from resources.lib.modules.http_session import get_session
 
 OMDB_STATUS_CODES = {
     200: "Success",
@@ -173,18 +174,12 @@ class OmdbApi(ApiBase):
 
     @cached_property
     def session(self):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3 import Retry
-
-        session = requests.Session()
-        retries = Retry(
+        return get_session(
+            "omdb",
             total=5,
             backoff_factor=0.1,
             status_forcelist=[500, 503, 504, 520, 521, 522, 524],
         )
-        session.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=100))
-        return session
 
     def _extract_awards(self, value, *params):
         if self._is_value_none(value):
@@ -10,6 +10,7 @@ from resources.lib.database.cache import use_cache
 from resources.lib.indexers.apibase import ApiBase
 from resources.lib.indexers.apibase import handle_single_item_or_list
 from resources.lib.modules.globals import g
+from resources.lib.modules.http_session import get_session
 
 
 def tmdb_guard_response(func):
@@ -290,18 +291,12 @@ class TMDBAPI(ApiBase):
 
     @cached_property
     def session(self):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3 import Retry
-
-        session = requests.Session()
-        retries = Retry(
+        return get_session(
+            "tmdb",
             total=5,
             backoff_factor=0.1,
             status_forcelist=[429, 500, 503, 504, 520, 521, 522, 524],
         )
-        session.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=100))
-        return session
 
     def _set_artwork(self):
         if self.preferred_artwork_size == 0:
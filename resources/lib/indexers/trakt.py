@@ -16,6 +16,8 @@ from resources.lib.modules.exceptions import AuthFailure
 from resources.lib.modules.exceptions import RanOnceAlready
 from resources.lib.modules.global_lock import GlobalLock
 from resources.lib.modules.globals import g
+from resources.lib.modules.http_session import get_session
+from resources.lib.modules.single_flight import coalesce_token_refresh
 
 CLOUDFLARE_ERROR_MSG = "Service Unavailable - Cloudflare error"
 
@@ -377,18 +379,12 @@ class TraktAPI(ApiBase):
 
     @cached_property
     def session(self):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3 import Retry
-
-        session = requests.Session()
-        retries = Retry(
+        return get_session(
+            "trakt",
             total=4,
             backoff_factor=0.3,
             status_forcelist=[429, 500, 502, 503, 504, 520, 521, 522, 524, 530],
         )
-        session.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=100))
-        return session
 
     # region Auth
     def _get_headers(self):
@@ -507,6 +503,7 @@ class TraktAPI(ApiBase):
             database.set_trakt_user(self.username)
             xbmc.executebuiltin(f'RunPlugin("{g.BASE_URL}?action=syncTraktActivities")')
 
+    @coalesce_token_refresh
     def try_refresh_token(self, force=False):
         """
         Attempts to refresh current Trakt Auth Token
@@ -18,6 +18,8 @@ from resources.lib.indexers.apibase import handle_single_item_or_list
 from resources.lib.modules.exceptions import RanOnceAlready
 from resources.lib.modules.global_lock import GlobalLock
 from resources.lib.modules.globals import g
+from resources.lib.modules.http_session import get_session
+from resources.lib.modules.single_flight import coalesce_token_refresh
 
 
 def tvdb_guard_response(func):
@@ -1162,14 +1164,7 @@ class TVDBAPI(ApiBase):
 
     @cached_property
     def session(self):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3 import Retry
-
-        session = requests.Session()
-        retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-        session.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=100))
-        return session
+        return get_session("tvdb", total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
 
     @cached_property
     def threadpool(self):
@@ -1184,6 +1179,7 @@ class TVDBAPI(ApiBase):
             headers["Accept-Language"] = lang
         return headers
 
+    @coalesce_token_refresh
     def try_refresh_token(self, force=False):
         if not force and self.tokenExpires > float(time.time()):
             return
@@ -416,7 +416,8 @@ class Sources:
     def _get_best_torrent_to_cache(sources):
         sources = [i for i in sources if i.get('seeds', 0) != 0 and i.get("magnet")]
 
-        for quality in [i for i in approved_qualities if i in source_utils.get_accepted_resolution_set()]:
+        accepted_resolutions = source_utils.get_accepted_resolution_set()
+        for quality in [i for i in approved_qualities if i in accepted_resolutions]:
             if quality_filter := [i for i in sources if i['quality'] == quality]:
                 packtype_filter = [i for i in quality_filter if i['package'] in ['show', 'season']]
 
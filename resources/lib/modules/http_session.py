@@ -0,0 +1,36 @@
+"""
+Process wide HTTP sessions shared between API client instances so that their connection pools are reused
+"""
+import threading
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(name, **retry_kwargs):
+    """
+    Returns the shared requests session for the named API, creating it on first use.
+    New client instances reuse the session's kept alive connections instead of opening a fresh TLS connection each.
+
+    :param name: Name of the API the session belongs to
+    :type name: str
+    :param retry_kwargs: Keyword arguments for the urllib3 Retry used when the session is created
+    :type retry_kwargs: dict
+    :return: The shared session
+    :rtype: requests.Session
+    """
+    session = _sessions.get(name)
+    if session is not None:
+        return session
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3 import Retry
+
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(max_retries=Retry(**retry_kwargs), pool_maxsize=100))
+            _sessions[name] = session
+    return session
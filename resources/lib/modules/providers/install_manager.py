@@ -10,6 +10,7 @@ import xbmc
 import xbmcgui
 import xbmcvfs
 
+from resources.lib.common import provider_tools
 from resources.lib.common import tools
 from resources.lib.modules.exceptions import FileIOError
 from resources.lib.modules.exceptions import InvalidMetaFormat
@@ -72,6 +73,7 @@ class ProviderInstallManager(CustomProviders, ZipManager):
             self._remove_legacy_meta_file(package_name)
             self.remove_provider_package(package_name)
             self.provider_settings.remove_package_settings(package_name)
+            provider_tools.clear_cache(package_name)
 
             if not silent:
                 xbmcgui.Dialog().ok(
@@ -221,6 +223,7 @@ class ProviderInstallManager(CustomProviders, ZipManager):
             install_progress.close()
 
         SettingsManager().create_settings(meta["name"], meta.get("settings", []))
+        provider_tools.clear_cache(meta["name"])
         g.log("Refreshing provider database ")
         self.add_provider_package(pack_name, author, remote_meta, version, services)
         self._do_package_pre_config(meta["name"], meta.get("setup_extension"))
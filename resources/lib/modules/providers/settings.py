@@ -49,6 +49,10 @@ class SettingsManager(ProviderCache):
         setting = self._get_package_setting(package_name, setting_id)
         return self._cast_setting(setting)
 
+    def get_all_settings(self, package_name):
+        settings = self.fetchall("SELECT id, type, value FROM package_settings WHERE package=?", (package_name,))
+        return {setting["id"]: self._cast_setting(setting) for setting in settings}
+
     def get_all_package_settings(self, package):
         return self.fetchall("SELECT * FROM package_settings WHERE package=?", (package,))
 
@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import Future
+from functools import wraps
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key so that only one executes and the other callers wait on its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Executes func unless a call for the same key is already running, in which case its result is awaited.
+        Re-entrant calls from the thread that owns the in flight call are executed directly.
+
+        :param key: Key identifying calls that may be coalesced
+        :type key: hashable
+        :param func: The function to execute
+        :type func: callable
+        :return: Tuple of the call result and a flag indicating if this caller executed func
+        :rtype: tuple
+        """
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                future = Future()
+                self._in_flight[key] = (future, threading.get_ident())
+
+        if in_flight is not None:
+            future, owner = in_flight
+            if owner != threading.get_ident():
+                return future.result(), False
+            return func(*args, **kwargs), True
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, True
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+_token_refreshes = SingleFlight()
+
+
+def coalesce_token_refresh(func):
+    """
+    Decorator for API try_refresh_token methods so that concurrent refreshes of the same API issue a single request.
+    Callers that joined an in flight refresh reload their settings to pick up the refreshed token.
+    """
+
+    @wraps(func)
+    def wrapper(self, force=False):
+        result, executed = _token_refreshes.do((self.__class__.__name__, force), func, self, force)
+        if not executed:
+            self._load_settings()
+        return result
+
+    return wrapper
@@ -1,4 +1,7 @@
 import sys
+
+import xbmc
+
 from resources.lib.modules import router
 from resources.lib.modules.globals import g
 from resources.lib.modules.serenMonitor import ONWAKE_NETWORK_UP_DELAY
@@ -9,21 +12,25 @@ def _sleeping_retry_handler():
     Handles retrying when the system is detected to be in a sleeping state.
     For Android platforms, it will check if the system is sleeping and wait for it to wake up.
     """
-    sleeping = False
-
-    if g.PLATFORM == "android":
-        attempts = 0
-        while (
-            attempts <= ONWAKE_NETWORK_UP_DELAY
-            and (sleeping := g.get_bool_runtime_setting("system.sleeping", False))
-            and not g.wait_for_abort(1)
-        ):
-            attempts += 1
-        if sleeping and not g.abort_requested():
-            g.log(
-                f"Ignoring {g.REQUEST_PARAMS.get('action', '')} plugin action as system is supposed to be \"sleeping\"",
-                "info",
-            )
+    if g.PLATFORM != "android" or not g.get_bool_runtime_setting("system.sleeping", False):
+        return True
+
+    # The flag lives in a window property cleared by the service once the network is up after a wake, so it can only
+    # be polled, but a single monitor is reused for the waits rather than one being created per second
+    monitor = xbmc.Monitor()
+    sleeping = True
+    for _ in range(ONWAKE_NETWORK_UP_DELAY + 1):
+        if aborted := monitor.waitForAbort(1):
+            break
+        if not (sleeping := g.get_bool_runtime_setting("system.sleeping", False)):
+            break
+    del monitor
+
+    if sleeping and not aborted:
+        g.log(
+            f"Ignoring {g.REQUEST_PARAMS.get('action', '')} plugin action as system is supposed to be \"sleeping\"",
+            "info",
+        )
 
     return not sleeping
 
@@ -1,5 +1,6 @@
 import sqlite3
 import sys
+import time
 from random import randint
 
 import xbmc
@@ -10,6 +11,7 @@ from resources.lib.common import tools
 if tools.is_stub():
     from mock_kodi import MOCK  # Ensure this import is only in the stub environment
 
+from resources.lib.common.thread_pool import ThreadPool
 from resources.lib.modules.globals import g
 from resources.lib.modules.seren_version import do_version_change
 from resources.lib.modules.serenMonitor import SerenMonitor
@@ -30,6 +32,28 @@ g.log(f"### Detected Kodi Version: {g.KODI_VERSION}")
 g.log(f"### Detected timezone: {repr(g.LOCAL_TIMEZONE.zone)}")
 g.log("#############  SERVICE ENTERED KEEP ALIVE  #################")
 
+
+def clear_kodi_bookmarks():
+    """
+    Clears Seren's bookmarks from the Kodi video database, logging the failure expected straight after an install.
+    """
+    try:
+        g.clear_kodi_bookmarks()
+    except TypeError:
+        g.log(
+            "Unable to clear bookmarks on service init. This is not a problem if it occurs immediately after install.",
+            "warning",
+        )
+
+
+# Maintenance actions and their offsets in seconds from the start of each cycle
+SCHEDULED_ACTIONS = (
+    (0, "runMaintenance"),
+    (15, "syncTraktActivities"),
+    (30, "cleanOrphanedMetadata"),
+    (45, "updateLocalTimezone"),
+)
+
 # Create an instance of the SerenMonitor
 monitor = SerenMonitor()
 
@@ -37,45 +61,38 @@ try:
     # Execute initial maintenance tasks
     xbmc.executebuiltin('RunPlugin("plugin://plugin.video.seren/?action=longLifeServiceManager")')
 
-    # Update news and validate detected timezone
+    # Clear Kodi bookmarks in the background while the startup dialogs are shown
+    thread_pool = ThreadPool()
+    thread_pool.put(clear_kodi_bookmarks)
+
+    # Update news and validate detected timezone, one after the other as both may show a dialog
     do_update_news()
     validate_timezone_detected()
-    
-    # Clear Kodi bookmarks, handle possible exceptions
-    try:
-        g.clear_kodi_bookmarks()
-    except TypeError:
-        g.log(
-            "Unable to clear bookmarks on service init. This is not a problem if it occurs immediately after install.",
-            "warning",
-        )
 
     # Clean up torrent cache
     xbmc.executebuiltin('RunPlugin("plugin://plugin.video.seren/?action=torrentCacheCleanup")')
+    thread_pool.wait_completion()
+    del thread_pool
+
+    # The service's own monitor is used for every wait rather than g.wait_for_abort creating a new one each time
+    wait_for_abort = monitor.waitForAbort
+    abort_requested = monitor.abortRequested
 
     # Allow widget loads to complete by waiting for 30 seconds
-    g.wait_for_abort(30)
+    wait_for_abort(30)
     
-    # Main service loop to run various maintenance tasks at intervals
-    while not monitor.abortRequested():
-        # Perform maintenance tasks with delays
-        xbmc.executebuiltin('RunPlugin("plugin://plugin.video.seren/?action=runMaintenance")')
-        
-        # Synchronize Trakt activities if not aborted
-        if not g.wait_for_abort(15):
-            xbmc.executebuiltin('RunPlugin("plugin://plugin.video.seren/?action=syncTraktActivities")')
-        
-        # Clean orphaned metadata if not aborted
-        if not g.wait_for_abort(15):
-            xbmc.executebuiltin('RunPlugin("plugin://plugin.video.seren/?action=cleanOrphanedMetadata")')
-        
-        # Update local timezone if not aborted
-        if not g.wait_for_abort(15):
-            xbmc.executebuiltin('RunPlugin("plugin://plugin.video.seren/?action=updateLocalTimezone")')
-        
-        # Sleep for a random interval between 13 and 17 minutes before repeating
-        if g.wait_for_abort(60 * randint(13, 17)):
-            break
+    # Main service loop running the scheduled actions, each due at a fixed offset from the start of its cycle so
+    # that time spent dispatching does not push back the actions after it
+    cycle_start = time.monotonic()
+    while not abort_requested():
+        for offset, action in SCHEDULED_ACTIONS:
+            delay = cycle_start + offset - time.monotonic()
+            if delay > 0 and wait_for_abort(delay):
+                break
+            xbmc.executebuiltin(f'RunPlugin("plugin://plugin.video.seren/?action={action}")')
+
+        # The next cycle starts a random interval between 13 and 17 minutes after the last action
+        cycle_start += SCHEDULED_ACTIONS[-1][0] + 60 * randint(13, 17)
 
 finally:
     # Clean up the monitor instance and deinitialize global settings and parameters
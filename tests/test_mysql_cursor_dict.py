@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("mysql.connector")
+
+from resources.lib.database.mysql_cursor_dict import MySQLCursorDict
+
+
+class FakeConnection:
+    """
+    Minimal stand-in for a MySQL connection serving rows from a list.
+    """
+
+    get_warnings = False
+    raise_on_warnings = False
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.unread_result = True
+        self.requested_counts = []
+
+    def get_rows(self, count=None):
+        self.requested_counts.append(count)
+        rows, self.rows = self.rows[:count], self.rows[count:]
+        eof = None if self.rows else {"warning_count": 0, "status_flag": 0}
+        return rows, eof
+
+
+def make_cursor(rows):
+    cursor = MySQLCursorDict()
+    cursor._connection = FakeConnection(rows)
+    cursor._column_names = ("id", "name")
+    return cursor
+
+
+def test_fetchmany_leaves_remaining_rows_unread():
+    cursor = make_cursor([(1, "a"), (2, "b"), (3, "c")])
+
+    assert cursor.fetchmany(2) == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    assert cursor._connection.requested_counts == [2]
+    assert cursor._connection.unread_result
+    assert cursor.rowcount == 2
+
+
+def test_fetchmany_handles_eof():
+    cursor = make_cursor([(1, "a"), (2, "b")])
+
+    assert cursor.fetchmany(5) == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    assert not cursor._connection.unread_result
+    assert cursor.rowcount == 2
+    assert cursor.fetchmany(5) == []
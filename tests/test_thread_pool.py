@@ -0,0 +1,64 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("xbmc")
+
+from resources.lib.common.thread_pool import ThreadPool
+from resources.lib.modules.globals import g
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    monkeypatch.setattr(g, "get_bool_runtime_setting", lambda *args, **kwargs: False)
+    monkeypatch.setattr(g, "get_int_setting", lambda *args, **kwargs: -1)
+    return ThreadPool()
+
+
+class BatchRecorder:
+    """
+    Batch function recording the batches it is called with.
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.called = threading.Event()
+
+    def __call__(self, items):
+        self.batches.append(list(items))
+        self.called.set()
+        return [[item * 2] for item in items]
+
+
+def test_put_batched_splits_by_max_batch(thread_pool):
+    batch_func = BatchRecorder()
+    for item in range(5):
+        thread_pool.put_batched(batch_func, item, max_batch=2, max_delay_ms=60000)
+
+    assert thread_pool.wait_completion() == [0, 2, 4, 6, 8]
+    assert sorted(batch_func.batches) == [[0, 1], [2, 3], [4]]
+
+
+def test_put_batched_submits_batch_older_than_max_delay(thread_pool):
+    batch_func = BatchRecorder()
+    thread_pool.put_batched(batch_func, 1, max_batch=10, max_delay_ms=1)
+    time.sleep(0.01)
+    thread_pool.put_batched(batch_func, 2, max_batch=10, max_delay_ms=1)
+
+    assert batch_func.called.wait(5)
+    assert batch_func.batches[0] == [1]
+    assert thread_pool.wait_completion() == [2, 4]
+    assert batch_func.batches == [[1], [2]]
+
+
+def test_put_batched_fails_items_when_submit_fails(thread_pool):
+    batch_func = BatchRecorder()
+    # Shut the executor down so that submitting the batch fails
+    thread_pool.executor.shutdown(wait=True)
+    thread_pool.put_batched(batch_func, 1, max_batch=10, max_delay_ms=60000)
+    thread_pool.put_batched(batch_func, 2, max_batch=10, max_delay_ms=60000)
+
+    with pytest.raises(RuntimeError):
+        thread_pool.wait_completion()
+    assert not batch_func.batches